@@ -39,6 +39,7 @@ Output file format arguments:
 Optional file format arguments:
   -t <theme>, --theme <theme>
                         specify the color theme for "xlsx" file output. Valid keywords are "grey", "blue", "green", "sakura", "purple", "aqua", "orange". If none is specified, defaults to "grey"
+  -z, --gzip            compress "csv" and "json" file output with gzip, and add the ".gz" extension to the file name
 
 Optional alert report arguments:
   -n, --owner           specify the owner of a GitHub repository, or organization. required if the "--repo" or "--org" options are specified.
@@ -50,6 +51,12 @@ Optional location arguments:
   -lk, --keyfile        specify file location for the encryption key file (".ghas_env") - overrides the location specified in the configuration file
   -lr, --reports        specify file location for the reports directory - overrides the location specified in the configuration file
 
+Optional cache arguments:
+  -nc, --no-cache       do not use or update the response cache (".ghas_cache.json"), which is stored in the configuration file location
+
+Optional concurrency arguments:
+  -j <N>, --jobs <N>    specify the number of projects processed concurrently. If none is specified, defaults to 4
+
 Requirements:
     - Python 3.6 or later
 
@@ -57,6 +64,7 @@ This script uses the following third-party libraries:
     - requests      (https://requests.readthedocs.io/en/master/)
     - cryptography  (https://cryptography.io/en/latest/)
     - openpyxl      (https://openpyxl.readthedocs.io/en/stable/)
+    - orjson        (https://github.com/ijl/orjson) - optional, used for faster JSON decoding and encoding if installed
 
 Dependencies:
     - ghas_enc_key.py
@@ -83,207 +91,935 @@ License: Apache License, Version 2.0 (http://www.apache.org/licenses/LICENSE-2.0
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from openpyxl.utils import get_column_letter
-from openpyxl.styles import PatternFill, Font, Border, Side, Alignment
-from openpyxl.worksheet.hyperlink import Hyperlink
-from cryptography.fernet import Fernet
+# requests, openpyxl, and cryptography are imported by the functions that use them, as importing them takes most of the startup time of the
+# script, which is wasted for --help, for errors in the arguments, and for the modules that a run doesn't need, such as openpyxl without XLSX output
+from collections import deque, namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from urllib.parse import parse_qs, parse_qsl, urlencode, urlparse
 import argparse
-import csv
+import gzip
+import io
 import json
-import requests
 import os
+import random
 import sys
+import threading
 import time
-import re
-import openpyxl
+
+# Use orjson for decoding and encoding JSON if it is installed, as it is considerably faster than the json module for large alert pages
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# GitHub REST API version, see https://docs.github.com/en/rest/overview/api-versions
+GITHUB_API_VERSION = '2022-11-28'
+
+# Maximum number of threads retrieving alerts concurrently for a project
+MAX_WORKERS = 16
+
+# Maximum number of concurrent requests to the GitHub API across all projects, to stay clear of the secondary rate limits
+MAX_CONCURRENT_REQUESTS = 32
+
+# Maximum number of repositories queried in a single GraphQL query
+GRAPHQL_BATCH_SIZE = 50
+
+# Maximum number of pages of an endpoint retrieved concurrently
+MAX_PAGE_WORKERS = 4
+
+# Default number of projects processed concurrently, can be changed with the --jobs option
+MAX_PROJECT_WORKERS = 4
+
+# Buffer size for writing report and cache files, large enough to write big files in few system calls
+WRITE_BUFFER_SIZE = 1024 * 1024
+
+# Limits the number of requests in flight to MAX_CONCURRENT_REQUESTS, shared by all threads
+request_slots = threading.BoundedSemaphore(MAX_CONCURRENT_REQUESTS)
+
+# Serializes the delays of throttled requests, so that concurrent requests are spread over time instead of waiting in parallel
+throttle_lock = threading.Lock()
+
+# Guards the alerts shared between projects that are processed concurrently
+fetched_alerts_lock = threading.Lock()
+
+# Guards the repository checks shared between projects that are processed concurrently
+checked_repositories_lock = threading.Lock()
+
+# Serializes the status messages of concurrent threads, so that each message is printed on a line of its own
+print_lock = threading.Lock()
+
+# Remaining requests of the primary rate limit below which requests are spread over the time until the rate limit resets
+RATE_LIMIT_THRESHOLD = 100
+
+# Maximum number of retries for requests that exceeded the GitHub API rate limit, or failed with a transient server error
+MAX_RETRIES = 5
+
+# Status codes of transient server errors, which are retried with an exponential backoff
+SERVER_ERROR_CODES = (502, 503, 504)
+
+# Severity levels counted in the Alert Count report, in the order of the report columns
+SEVERITY_LEVELS = ('critical', 'high', 'medium', 'low', 'warning', 'note', 'error')
+
+# Report type of each alert type, used for the report file names and to select the column headers
+REPORT_NAMES = {
+    'alerts': 'alert_count',
+    'codescan': 'code_scan',
+    'secretscan': 'secret_scan',
+    'dependabot': 'dependabot_scan'
+}
+
+# Column headers of each report type, written once before the rows of each report
+REPORT_HEADERS = {
+    'alert_count': ('Organization', 'Repository', 'Scan Type', 'Total Alerts', 'Critical', 'High', 'Medium', 'Low', 'Warning', 'Note', 'Error'),
+    'code_scan': ('Alert', 'Organization', 'Repository', 'Date Created', 'Date Updated', 'Days Open', 'Severity', 'State', 'Rule ID', 'Description', 'Category', 'File', 'Fixed At', 'Dismissed At', 'Dismissed By', 'Dismissed Reason', 'Dismissed Comment', 'Tool', 'GitHub URL'),
+    'secret_scan': ('Alert', 'Organization', 'Repository', 'Date Created', 'Date Updated', 'Days Open', 'State', 'Resolved At', 'Resolved By', 'Resolved Reason', 'Secret Type Name', 'Secret Type', 'GitHub URL'),
+    'dependabot_scan': ('Alert', 'Organization', 'Repository', 'Date Created', 'Date Updated', 'Days Open', 'Severity', 'State', 'Package Name', 'CVE ID', 'Summary', 'Fixed At', 'Dismissed At', 'Dismissed By', 'Dismissed Reason', 'Dismissed Comment', 'Scope', 'Manifest ID', 'GitHub URL')
+}
+
+# The owner, organizations, and repositories of a project, converted once from the configuration, as tuples without empty names
+Project = namedtuple('Project', ['owner', 'organizations', 'repositories'])
+
+class GitHubAPIError(Exception):
+    """Base class for errors returned by the GitHub API."""
+
+class AuthenticationError(GitHubAPIError):
+    """The API key is invalid or has expired. Unlike other errors, this error aborts the script instead of skipping the failing resource."""
+
+class RateLimitError(GitHubAPIError):
+    """The GitHub API rate limit was exceeded, and the request could not be retried successfully."""
+
+class ForbiddenError(GitHubAPIError):
+    """Access to the resource is forbidden, e.g. if GitHub Advanced Security is not enabled for the repository."""
+
+class NotFoundError(GitHubAPIError):
+    """The organization, repository, or alert endpoint was not found."""
+
+# Default error messages of the GitHub API status codes, used if the response doesn't include a message
+ERROR_MESSAGES = {
+    304: 'Not modified',
+    400: 'Bad Request',
+    401: 'Bad credentials',
+    403: 'GitHub Advanced Security is not enabled for this repository',
+    404: 'Resource not found',
+    422: 'Validation failed, or the endpoint has been spammed',
+    503: 'Service unavailable'
+}
+
+# Exception classes raised for the GitHub API status codes, any other status code raises GitHubAPIError
+ERROR_CLASSES = {401: AuthenticationError, 403: ForbiddenError, 404: NotFoundError}
+
+def print_status(message):
+    """Print a status message on a line of its own, also if other threads print at the same time.
+
+    Args:
+        message (str): The message to print.
+    """
+    with print_lock:
+        sys.stdout.write(message + '\n')
+
+def json_loads(data):
+    """Decode a JSON document, using orjson if it is installed, or the json module otherwise.
+
+    Args:
+        data (bytes or str): The JSON document.
+
+    Returns:
+        any: The decoded JSON document.
+
+    Raises:
+        json.JSONDecodeError: If the document is not valid JSON (orjson.JSONDecodeError is a subclass).
+    """
+    return orjson.loads(data) if orjson else json.loads(data)
+
+def json_dumps(obj):
+    """Encode an object as a compact UTF-8 JSON document, using orjson if it is installed, or the json module otherwise.
+
+    Args:
+        obj (any): The object to encode.
+
+    Returns:
+        bytes: The encoded JSON document.
+    """
+    return orjson.dumps(obj) if orjson else json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
 
 def api_error_response(response):
-    """Generate error message from API response.
+    """Generate error message from API response and raise the corresponding exception.
 
     Args:
         response (requests.Response): API response object.
 
-    Returns:
-        str: Error message.
+    Raises:
+        AuthenticationError: If the API key is invalid or has expired.
+        RateLimitError: If the GitHub API rate limit was exceeded.
+        ForbiddenError: If access to the resource is forbidden.
+        NotFoundError: If the resource was not found.
+        GitHubAPIError: For any other error response.
 
     Examples:
         >>> response = requests.get('https://api.example.com')
         >>> api_error_response(response)
-        'Error 404: Resource not found'
-    """
-    error_messages = {
-        304: f"Error {response.status_code}: {response.json().get('message', 'Not modified')}" + (f", Errors: {response.json().get('errors', '')}" if response.json().get('errors') else ''),
-        400: f"Error {response.status_code}: {response.json().get('message', 'Bad Request')}" + (f", Errors: {response.json().get('errors', '')}" if response.json().get('errors') else ''),
-        403: f"Error {response.status_code}: {response.json().get('message', 'GitHub Advanced Security is not enabled for this repository')}" + (f", Errors: {response.json().get('errors', '')}" if response.json().get('errors') else ''),
-        404: f"Error {response.status_code}: {response.json().get('message', 'Resource not found')}" + (f", Errors: {response.json().get('errors', '')}" if response.json().get('errors') else ''),
-        422: f"Error {response.status_code}: {response.json().get('message', 'Validation failed, or the endpoint has been spammed')}" + (f", Errors: {response.json().get('errors', '')}" if response.json().get('errors') else ''),
-        503: f"Error {response.status_code}: {response.json().get('message', 'Service unavailable')}" + (f", Errors: {response.json().get('errors', '')}" if response.json().get('errors') else '')
+        Traceback (most recent call last):
+        NotFoundError: Error 404: Resource not found
+    """
+    # Decode the response body once, error responses without a JSON body, e.g. from a proxy, fall back to the default message
+    try:
+        body = json_loads(response.content)
+    except ValueError:
+        body = None
+    body = body if isinstance(body, dict) else {}
+
+    if rate_limit_delay(response) is not None:
+        error_class = RateLimitError
+    else:
+        error_class = ERROR_CLASSES.get(response.status_code, GitHubAPIError)
+
+    error_message = f"Error {response.status_code}: {body.get('message', ERROR_MESSAGES.get(response.status_code, ''))}"
+    if body.get('errors'):
+        error_message += f", Errors: {body['errors']}"
+
+    raise error_class(error_message)
+
+def rate_limit_delay(response, attempt=0):
+    """Determine how long to wait before retrying a request that exceeded the GitHub API rate limit.
+
+    The delay is taken from the 'Retry-After' header if present in seconds, or from the 'X-RateLimit-Reset' header if the primary
+    rate limit is exhausted. If a secondary rate limit was exceeded without either header, or with a 'Retry-After' header that is
+    not a number of seconds, an exponential backoff starting at one minute is used, as recommended by the GitHub API documentation.
+
+    Args:
+        response (requests.Response): API response object.
+        attempt (int, optional): The number of retries already made for the request. Defaults to 0.
+
+    Returns:
+        float: The number of seconds to wait before retrying, or None if the request did not exceed the rate limit.
+    """
+    if response.status_code not in (403, 429):
+        return None
+
+    try:
+        return float(response.headers['Retry-After'])
+    except (KeyError, ValueError):
+        pass
+
+    if response.headers.get('X-RateLimit-Remaining') == '0':
+        return max(float(response.headers.get('X-RateLimit-Reset', 0)) - time.time(), 0)
+
+    if response.status_code == 429 or 'rate limit' in response.text.lower():
+        return 60 * 2 ** attempt
+
+    return None
+
+def server_error_delay(response, attempt=0):
+    """Determine how long to wait before retrying a request that failed with a transient server error.
+
+    The delay is taken from the 'Retry-After' header if present, otherwise an exponential backoff starting at one second is used.
+
+    Args:
+        response (requests.Response): API response object.
+        attempt (int, optional): The number of retries already made for the request. Defaults to 0.
+
+    Returns:
+        float: The number of seconds to wait before retrying, or None if the request did not fail with a transient server error.
+    """
+    if response.status_code not in SERVER_ERROR_CODES:
+        return None
+
+    try:
+        return float(response.headers['Retry-After'])
+    except (KeyError, ValueError):
+        return 2 ** attempt
+
+def throttle_delay(response):
+    """Determine how long to wait before sending the next request, to avoid exhausting the GitHub API rate limit.
+
+    Once fewer than RATE_LIMIT_THRESHOLD requests of the primary rate limit remain, the remaining requests are spread
+    evenly over the time until the rate limit resets, instead of exhausting it and waiting for the reset afterwards.
+
+    Args:
+        response (requests.Response): API response object.
+
+    Returns:
+        float: The number of seconds to wait before sending the next request, or 0 if there are enough requests remaining.
+    """
+    try:
+        remaining = int(response.headers['X-RateLimit-Remaining'])
+        reset = float(response.headers['X-RateLimit-Reset'])
+    except (KeyError, ValueError):
+        return 0
+
+    if remaining >= RATE_LIMIT_THRESHOLD:
+        return 0
+
+    return max(reset - time.time(), 0) / (remaining + 1)
+
+def api_get(session, url, headers=None, method='GET', body=None):
+    """Send a GET (or HEAD or POST) request to the GitHub API, waiting and retrying if the rate limit was exceeded or a transient server error occurred.
+
+    A random jitter of up to one second is added to each delay, so that concurrent requests don't retry all at once. At most
+    MAX_CONCURRENT_REQUESTS requests are sent at the same time, a request slot is not held while waiting to retry. If the
+    rate limit is almost exhausted, the request is delayed after the response is received, as determined by throttle_delay.
+
+    Args:
+        session (requests.Session): The session used for making requests to the GitHub API.
+        url (str): The URL to request.
+        headers (dict, optional): Additional headers to send with the request. Defaults to None.
+        method (str, optional): The HTTP method of the request, either 'GET', 'HEAD', or 'POST'. Defaults to 'GET'.
+        body (dict, optional): The JSON body of the request, such as a GraphQL query. Defaults to None.
+
+    Returns:
+        requests.Response: The API response object of the last attempt.
+    """
+    for attempt in range(MAX_RETRIES + 1):
+        with request_slots:
+            response = session.request(method, url, headers=headers, json=body)
+        delay = rate_limit_delay(response, attempt)
+        reason = 'Rate limit exceeded'
+
+        if delay is None:
+            delay = server_error_delay(response, attempt)
+            reason = f"Server error {response.status_code}"
+
+        if delay is None or attempt == MAX_RETRIES:
+            break
+
+        print_status(f"{reason}, retrying in {delay:.0f} seconds: {url}")
+        time.sleep(delay + random.random())
+
+    # Slow down before the next request if the rate limit is almost exhausted
+    delay = throttle_delay(response)
+    if delay:
+        with throttle_lock:
+            time.sleep(delay)
+
+    return response
+
+def create_session(api_key, api_version=GITHUB_API_VERSION):
+    """Create a requests session for making requests to the GitHub API.
+
+    The session keeps connections to the GitHub API alive and reuses them across requests, which avoids a new TCP and TLS
+    handshake for every request. The connection pool holds a connection for each of the MAX_CONCURRENT_REQUESTS requests that
+    may be sent at the same time, and requests wait for a pooled connection to become available instead of opening additional connections.
+    Failed connections are retried up to MAX_RETRIES times without a delay, while transient server errors and rate limit responses are
+    left to api_get, which waits without holding a request slot.
+
+    Args:
+        api_key (str): The API key used to authenticate every request to the GitHub API.
+        api_version (str, optional): The GitHub REST API version to request. Defaults to GITHUB_API_VERSION.
+
+    Returns:
+        requests.Session: The configured session object.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    session = requests.Session()
+    session.headers.update({
+        'Authorization': f"token {api_key}",
+        'X-GitHub-Api-Version': api_version
+    })
+
+    # Don't retry any responses, including those with a 'Retry-After' header, which urllib3 would otherwise retry while holding the request slot
+    retries = Retry(total=MAX_RETRIES, status=0, backoff_factor=0, status_forcelist=None, respect_retry_after_header=False, raise_on_status=False)
+    adapter = HTTPAdapter(pool_connections=MAX_WORKERS, pool_maxsize=MAX_CONCURRENT_REQUESTS, pool_block=True, max_retries=retries)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+
+    return session
+
+def load_cache(cache_file):
+    """Load the response cache from the given cache file.
+
+    The response cache maps the URL of each requested page to the 'ETag' header, the next and last page URLs, and the decoded
+    content of the last response, or to the 'ETag' header and the alert count for requests that only count the alerts. It is
+    used to make conditional requests to the GitHub API, so unchanged pages don't have to be downloaded again. The cache file
+    is decoded with orjson if it is installed, as it holds the content of all pages. A missing or invalid cache file results
+    in an empty cache.
+
+    Args:
+        cache_file (str): The path to the cache file.
+
+    Returns:
+        dict: A dictionary containing the cache file path, the cache entries loaded from the file, and the cache entries
+              updated during the current run (which are the only ones written back by save_cache).
+    """
+    try:
+        with open(cache_file, 'rb') as f:
+            entries = json_loads(f.read())
+    except (FileNotFoundError, ValueError):
+        entries = {}
+
+    return {'file': cache_file, 'entries': entries, 'updated': {}}
+
+def save_cache(cache):
+    """Write the cache entries updated during the current run to the cache file.
+
+    Entries that were not requested during the current run are dropped, so the cache file doesn't grow indefinitely. The
+    cache file is created with permissions restricted to the current user, as the cached alerts may contain sensitive data.
+
+    Args:
+        cache (dict): The response cache returned by load_cache.
+    """
+    try:
+        # Create the file readable by the current user only, instead of restricting the permissions after the cached alerts were written
+        with os.fdopen(os.open(cache['file'], os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+            # An existing cache file keeps its permissions, so restrict them as well
+            os.chmod(cache['file'], 0o600)
+            f.write(json_dumps(cache['updated']))
+    except IOError as e:
+        print_status(f"Error writing to {e.filename}: {e}")
+
+def paginate(session, url, cache=None):
+    """Retrieve all pages of a paginated GitHub API endpoint.
+
+    Follows the 'next' URL from the 'Link' header of each response until the last page is reached. This works for both
+    page-based and cursor-based pagination, as the GitHub API always provides the complete URL of the next page. The next
+    page is requested as soon as its URL is known, so it is downloaded while the current page is decoded and processed.
+    For page-based pagination, the 'last' URL reveals the URLs of all remaining pages, so they are requested concurrently,
+    using up to MAX_PAGE_WORKERS threads, and yielded in order.
+
+    If a response cache is given, each request is sent with the 'If-None-Match' header set to the cached 'ETag'. When the
+    GitHub API responds with 304 Not Modified, the cached page is used instead, which doesn't count against the rate limit.
+
+    Args:
+        session (requests.Session): The session used for making requests to the GitHub API.
+        url (str): The URL of the first page, including any query parameters.
+        cache (dict, optional): The response cache returned by load_cache. Defaults to None (no caching).
+
+    Yields:
+        list: The decoded JSON content of each page.
+
+    Raises:
+        GitHubAPIError: If the GitHub API returns an error response.
+    """
+    def request_page(url):
+        """Requests a page, sending the cached 'ETag' if available, and returns the URL, the cache entry, and the response."""
+        cached = cache['entries'].get(url) if cache is not None else None
+        return url, cached, api_get(session, url, headers={'If-None-Match': cached['etag']} if cached else None)
+
+    # The page threads are only started once a second page is requested, so single page endpoints don't need one
+    with ThreadPoolExecutor(max_workers=MAX_PAGE_WORKERS) as prefetch:
+        pending = deque()
+        url, cached, response = request_page(url)
+
+        while response is not None:
+            if response.status_code == 304 and cached:
+                next_url, last_url = cached['next'], cached.get('last')
+            elif response.status_code == 200:
+                # Get the next and last page URLs from the 'Link' header if present
+                next_url = response.links.get('next', {}).get('url')
+                last_url = response.links.get('last', {}).get('url')
+            else:
+                api_error_response(response)
+
+            # Request the next page, or all remaining pages if the last page is known, in the background while the current page is decoded and processed
+            if next_url and not pending:
+                pending.extend(prefetch.submit(request_page, page_url) for page_url in get_page_urls(next_url, last_url))
+
+            if response.status_code == 200:
+                page = json_loads(response.content)
+                cached = {'etag': response.headers['ETag'], 'next': next_url, 'last': last_url, 'content': page} if response.headers.get('ETag') else None
+            else:
+                page = cached['content']
+
+            if cache is not None and cached:
+                cache['updated'][url] = cached
+
+            if not page:
+                for future in pending:
+                    future.cancel()
+                break
+
+            yield page
+
+            url, cached, response = pending.popleft().result() if pending else (None, None, None)
+
+def get_page_urls(next_url, last_url=None):
+    """Return the URLs of all pages from the next page up to the last page of an endpoint using page-based pagination.
+
+    Args:
+        next_url (str): The URL of the next page, from the 'Link' header.
+        last_url (str, optional): The URL of the last page, from the 'Link' header. Defaults to None.
+
+    Returns:
+        list: The URLs of the remaining pages, or only the next page URL if the endpoint doesn't use page-based pagination.
+    """
+    next_page = parse_qs(urlparse(next_url).query).get('page') if last_url else None
+    last_page = parse_qs(urlparse(last_url).query).get('page') if last_url else None
+
+    if not next_page or not last_page:
+        return [next_url]
+
+    # Build the page URLs from the last page URL, replacing only the page number, so the query parameters stay in the same order
+    last_parts = urlparse(last_url)
+    query = parse_qsl(last_parts.query)
+
+    return [
+        last_parts._replace(query=urlencode([(key, str(page) if key == 'page' else value) for key, value in query])).geturl()
+        for page in range(int(next_page[0]), int(last_page[0]) + 1)
+    ]
+
+def get_alerts_url(api_url, call_func, org_name=None, owner=None, repo_name=None):
+    """Build the URL of the alerts endpoint for a scan type and an organization or repository.
+
+    Args:
+        api_url (str): The base URL for the GitHub API.
+        call_func (str): The type of scan alerts ('codescan', 'secretscan', 'dependabot').
+        org_name (str, optional): The name of the organization, if no repository is specified.
+        owner (str, optional): The name of the repository owner.
+        repo_name (str, optional): The name of the repository.
+
+    Returns:
+        str: The URL of the alerts endpoint, without query parameters.
+    """
+    scan_types = {
+        'codescan': 'code-scanning',
+        'secretscan': 'secret-scanning',
+        'dependabot': 'dependabot'
     }
-    
-    if response.status_code in error_messages:
-        error_message = error_messages[response.status_code]
-        raise Exception(error_message)
+
+    return f"{api_url}/repos/{owner}/{repo_name}/{scan_types[call_func]}/alerts" if repo_name else f"{api_url}/orgs/{org_name}/{scan_types[call_func]}/alerts"
+
+def repo_exists(session, api_url, owner, repo_name):
+    """Check whether a repository exists with a single HEAD request, before requesting its alerts.
+
+    Only a 404 response marks a repository as missing; any other error is left to the alert requests, which report it in detail.
+
+    Args:
+        session (requests.Session): The session used for making requests to the GitHub API.
+        api_url (str): The base URL for the GitHub API.
+        owner (str): The name of the repository owner.
+        repo_name (str): The name of the repository.
+
+    Returns:
+        bool: False if the repository was not found, True otherwise.
+    """
+    import requests
+
+    try:
+        response = api_get(session, f"{api_url}/repos/{owner}/{repo_name}", method='HEAD')
+    except requests.RequestException:
+        return True
+
+    if response.status_code == 404:
+        print_status(f"Repository not found, skipping: {owner}/{repo_name}")
+        return False
+
+    return True
+
+def load_project(project_data):
+    """Convert the data of a project from the configuration file or the command-line arguments to a Project.
+
+    Args:
+        project_data (dict): A dictionary containing project data, including organizations, repositories, and owner.
+
+    Returns:
+        Project: The project, without empty organization and repository names.
+    """
+    return Project(
+        owner=project_data.get('owner'),
+        organizations=tuple(org_name for org_name in project_data.get('organizations') or [] if org_name),
+        repositories=tuple(repo_name for repo_name in project_data.get('repositories') or [] if repo_name)
+    )
+
+def get_existing_repositories(session, api_url, project_data, checked_repositories=None):
+    """Return the project data without the repositories that don't exist, checking all repositories concurrently.
+
+    If a repository is part of multiple projects, it is checked by the first project and the result is reused by the others through
+    checked_repositories, so every repository is checked, and a missing repository reported, only once per run.
+
+    Args:
+        session (requests.Session): The session used for making requests to the GitHub API.
+        api_url (str): The base URL for the GitHub API.
+        project_data (Project): The owner, organizations, and repositories of the project.
+        checked_repositories (dict, optional): The repository checks of all projects so far, shared by all calls of a run. Defaults to None.
+
+    Returns:
+        Project: A copy of project_data, with only the repositories that exist.
+    """
+    owner, repositories = project_data.owner, project_data.repositories
+    checked_repositories = {} if checked_repositories is None else checked_repositories
+
+    if not owner or not repositories:
+        return project_data
+
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        # Check the repositories that no other project has checked yet, and wait for the checks of the others
+        with checked_repositories_lock:
+            for repo_name in repositories:
+                if (owner, repo_name) not in checked_repositories:
+                    checked_repositories[(owner, repo_name)] = executor.submit(repo_exists, session, api_url, owner, repo_name)
+            futures = [checked_repositories[(owner, repo_name)] for repo_name in repositories]
+
+        exists = [future.result() for future in futures]
+
+    return project_data._replace(repositories=tuple(repo_name for repo_name, repo_found in zip(repositories, exists) if repo_found))
+
+def get_open_alert_count(session, api_url, call_func, org_name=None, owner=None, repo_name=None, cache=None):
+    """Retrieve the number of open alerts for a scan type without downloading the alerts.
+
+    Requests a single alert per page, so the page number of the 'last' link in the 'Link' header equals the number of open
+    alerts. If there is only one page, the number of alerts on that page is returned instead. If a response cache is given,
+    the request is conditional, and the cached count is returned if the alerts haven't changed since the last run.
+
+    Args:
+        session (requests.Session): The session used for making requests to the GitHub API.
+        api_url (str): The base URL for the GitHub API.
+        call_func (str): The type of scan alerts ('codescan', 'secretscan', 'dependabot').
+        org_name (str, optional): The name of the organization to retrieve the alert count for.
+        owner (str, optional): The name of the repository owner.
+        repo_name (str, optional): The name of the repository to retrieve the alert count for.
+        cache (dict, optional): The response cache returned by load_cache. Defaults to None (no caching).
+
+    Returns:
+        int: The number of open alerts, or None if the endpoint uses cursor-based pagination and provides no 'last' link.
+
+    Raises:
+        GitHubAPIError: If the GitHub API returns an error response.
+    """
+    url = f"{get_alerts_url(api_url, call_func, org_name, owner, repo_name)}?per_page=1&state=open"
+    cached = cache['entries'].get(url) if cache is not None else None
+    response = api_get(session, url, headers={'If-None-Match': cached['etag']} if cached else None)
+
+    if response.status_code == 304 and cached:
+        count = cached['count']
+    elif response.status_code != 200:
+        api_error_response(response)
+    elif 'last' in response.links:
+        count = int(parse_qs(urlparse(response.links['last']['url']).query)['page'][0])
+    elif 'next' in response.links:
+        return None
     else:
-        raise Exception(f"Error {response.status_code}: {response.json().get('message', '')}" + (f", Errors: {response.json().get('errors', '')}" if response.json().get('errors') else ''))
+        count = len(json_loads(response.content))
+
+    # Cache the count, not the single alert on the page, as only the count is needed for the next run
+    if cache is not None:
+        if response.status_code == 200 and response.headers.get('ETag'):
+            cached = {'etag': response.headers['ETag'], 'count': count}
+        if cached:
+            cache['updated'][url] = cached
+
+    return count
+
+def get_graphql_url(api_url):
+    """Derive the URL of the GitHub GraphQL API from the URL of the GitHub REST API.
+
+    Args:
+        api_url (str): The base URL for the GitHub REST API, e.g. "https://api.github.com" or "https://HOSTNAME/api/v3" for GitHub Enterprise Server.
+
+    Returns:
+        str: The URL of the GitHub GraphQL API.
+    """
+    api_url = api_url.rstrip('/')
+    return f"{api_url[:-len('/v3')]}/graphql" if api_url.endswith('/api/v3') else f"{api_url}/graphql"
+
+def get_dependabot_alert_counts(session, api_url, owner, repo_names):
+    """Retrieve the open Dependabot alert count and severity counts for multiple repositories with GraphQL queries.
+
+    The repositories are queried in batches of up to GRAPHQL_BATCH_SIZE repositories per query, and the batches are sent
+    concurrently. The queries select only the severity of each open alert, instead of downloading the complete alerts of
+    each repository from the REST API. Repositories that are not found, have Dependabot alerts disabled, or couldn't be
+    queried are left out of the result, so their alert count can be retrieved from the REST API.
+
+    Args:
+        session (requests.Session): The session used for making requests to the GitHub API.
+        api_url (str): The base URL for the GitHub API.
+        owner (str): The name of the repository owner.
+        repo_names (list): The names of the repositories to retrieve the alert count for.
+
+    Returns:
+        dict: A dictionary mapping repository names to the open alert count followed by the count for each severity level.
+    """
+    batches = [repo_names[index:index + GRAPHQL_BATCH_SIZE] for index in range(0, len(repo_names), GRAPHQL_BATCH_SIZE)]
+
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        batch_counts = list(executor.map(lambda batch: query_dependabot_alert_counts(session, api_url, owner, batch), batches))
+
+    return {repo_name: sev_list for alert_counts in batch_counts for repo_name, sev_list in alert_counts.items()}
+
+def query_dependabot_alert_counts(session, api_url, owner, repo_names):
+    """Count the open Dependabot alerts and their severity levels for a batch of repositories with aliased GraphQL queries.
+
+    The first query selects the first 100 open alerts of all repositories at once. Repositories with more open alerts are
+    queried again for their next page, until all pages have been counted, so every further query only includes the
+    repositories that have more pages.
+
+    Args:
+        session (requests.Session): The session used for making requests to the GitHub API.
+        api_url (str): The base URL for the GitHub API.
+        owner (str): The name of the repository owner.
+        repo_names (list): The names of the repositories to retrieve the alert count for.
+
+    Returns:
+        dict: A dictionary mapping repository names to the open alert count followed by the count for each severity level.
+    """
+    import requests
+
+    severity_levels = {'CRITICAL': 'critical', 'HIGH': 'high', 'MODERATE': 'medium', 'LOW': 'low'}
+    alert_counts = {}
+    sev_counts = {index: dict.fromkeys(SEVERITY_LEVELS, 0) for index in range(len(repo_names))}
+
+    # Map the index of each repository that has more pages to the cursor of its next page, starting with the first page of all repositories
+    cursors = dict.fromkeys(range(len(repo_names)))
+
+    while cursors:
+        # Query each repository under its own alias, the names and cursors are quoted as JSON strings, which are valid GraphQL strings
+        query = '\n'.join(
+            f"repo{index}: repository(owner: {json.dumps(owner)}, name: {json.dumps(repo_names[index])}) {{ hasVulnerabilityAlertsEnabled vulnerabilityAlerts(states: OPEN, first: 100{f', after: {json.dumps(cursor)}' if cursor else ''}) {{ totalCount pageInfo {{ hasNextPage endCursor }} nodes {{ securityAdvisory {{ severity }} }} }} }}"
+            for index, cursor in cursors.items()
+        )
+
+        try:
+            response = api_get(session, get_graphql_url(api_url), method='POST', body={'query': f"query {{\n{query}\n}}"})
+            data = (json_loads(response.content).get('data') or {}) if response.status_code == 200 else {}
+        except (requests.RequestException, ValueError):
+            return alert_counts
+
+        next_cursors = {}
+        for index in cursors:
+            repository = data.get(f"repo{index}") or {}
+            vulnerability_alerts = repository.get('vulnerabilityAlerts')
 
-def get_scan_alerts(api_url, org_name=None, call_func=None, owner=None, repo_name=None, state=None):
+            # Skip the repositories that couldn't be queried, for example without access to their Dependabot alerts, which returns a partial
+            # error and no alerts for the repository, so their alert count is retrieved from the REST API instead
+            if not repository.get('hasVulnerabilityAlertsEnabled') or not vulnerability_alerts:
+                continue
+
+            for alert in vulnerability_alerts.get('nodes') or []:
+                sev = severity_levels.get(safe_get(alert, ['securityAdvisory', 'severity']))
+                if sev:
+                    sev_counts[index][sev] += 1
+
+            page_info = vulnerability_alerts.get('pageInfo') or {}
+            if page_info.get('hasNextPage') and page_info.get('endCursor'):
+                next_cursors[index] = page_info['endCursor']
+            elif not page_info.get('hasNextPage'):
+                alert_counts[repo_names[index]] = [vulnerability_alerts['totalCount'], *sev_counts[index].values()]
+
+        cursors = next_cursors
+
+    return alert_counts
+
+def get_scan_alerts(session, api_url, org_name=None, call_func=None, owner=None, repo_name=None, state=None, cache=None):
     """Retrieve alerts for a specific scan type from the GitHub API and count the open alerts and their corresponding severity levels.
 
     Args:
+        session (requests.Session): The session used for making requests to the GitHub API.
         api_url (str): The base URL for the GitHub API.
         org_name (str, optional): The name of the organization to retrieve alerts for.
         call_func (str, optional): The type of scan alerts to retrieve ('codescan', 'secretscan', 'dependabot').
         owner (str, optional): The name of the repository owner.
         repo_name (str, optional): The name of the repository to retrieve alerts for.
         state (str, optional): The state of the alerts to retrieve ('open', 'closed', or None for all).
+        cache (dict, optional): The response cache returned by load_cache. Defaults to None (no caching). Secret Scanning alerts are never
+                                cached, as they contain the plaintext secrets.
 
     Returns:
         tuple: A tuple containing a list of scan_alerts and a list of severity counts (sev_list).
-
-    Nested Functions:
-        alerts_count(alerts, sev_counts)
-        get_next_page_link(link_header)
     """
-    scan_types = {
-        'codescan': 'code-scanning',
-        'secretscan': 'secret-scanning',
-        'dependabot': 'dependabot'
-    }
-
-    base_url = f"{api_url}/repos/{owner}/{repo_name}/{scan_types[call_func]}/alerts" if repo_name else f"{api_url}/orgs/{org_name}/{scan_types[call_func]}/alerts"
+    base_url = get_alerts_url(api_url, call_func, org_name, owner, repo_name)
     state_query = '&state=open' if state == 'open' else ''
 
     scan_alerts = []
-    open_alert_count = 0
-    sev_counts = {
-        'critical': 0,
-        'high': 0,
-        'medium': 0,
-        'low': 0,
-        'warning': 0,
-        'note': 0,
-        'error': 0
-    }
 
-    def alerts_count(alerts, sev_counts):
-        """Counts the open alerts and their corresponding severity levels for the given list of alerts.
+    # Retrieve all pages of alerts, 100 alerts per page (the maximum allowed by the GitHub API)
+    url = f"{base_url}?per_page=100{state_query}"
 
-        Args:
-            alerts (list): A list of alert dictionaries.
-            sev_counts (dict): A dictionary to store the counts for each severity level.
+    # Don't write the Secret Scanning alerts to the cache file, as each alert contains the plaintext secret
+    for alerts in paginate(session, url, None if call_func == 'secretscan' else cache):
+        scan_alerts.extend(alerts)
 
-        Returns:
-            None
-        """
-        nonlocal open_alert_count
-        for alert in alerts:
-            if alert['state'] == 'open':
-                open_alert_count += 1
-                sev = None
+    return scan_alerts, count_alerts(scan_alerts, call_func)
 
-                if call_func == 'codescan':
-                    sev = alert.get('rule', {}).get('security_severity_level') or alert.get('rule', {}).get('severity', '').lower()
-                elif call_func == 'dependabot':
-                    sev = alert['security_advisory']['severity'].lower() if 'severity' in alert['security_advisory'] else None
+def count_alerts(alerts, call_func):
+    """Counts the open alerts and their corresponding severity levels for the given list of alerts.
 
-                if sev and sev in sev_counts:
-                    sev_counts[sev] += 1
+    Args:
+        alerts (list): A list of alert dictionaries.
+        call_func (str): The type of scan alerts ('codescan', 'secretscan', 'dependabot').
 
-    def get_next_page_link(link_header):
-        """Extracts the next page URL from the 'Link' header in a paginated API response.
+    Returns:
+        list: The open alert count followed by the count for each severity level (sev_list).
+    """
+    open_alert_count = 0
+    sev_counts = dict.fromkeys(SEVERITY_LEVELS, 0)
 
-        Args:
-            link_header (str): The 'Link' header value from an API response.
+    for alert in alerts:
+        if alert['state'] == 'open':
+            open_alert_count += 1
+            sev = None
 
-        Returns:
-            str: The URL of the next page, or None if not found.
-        """
-        if link_header:
-            next_page_link = re.search(r'<(.+?)>; rel="next"', link_header)
-            return next_page_link.group(1) if next_page_link else None
-        return None
+            if call_func == 'codescan':
+                sev = alert.get('rule', {}).get('security_severity_level') or alert.get('rule', {}).get('severity', '').lower()
+            elif call_func == 'dependabot':
+                sev = alert['security_advisory']['severity'].lower() if 'severity' in alert['security_advisory'] else None
 
-    if call_func == 'codescan':
-        page_no = 1
+            if sev and sev in sev_counts:
+                sev_counts[sev] += 1
 
-        while True:
-            url = f"{base_url}?page={page_no}{state_query}"
-            response = requests.get(url, headers=headers)
+    return [open_alert_count, *sev_counts.values()]
 
-            if response.status_code == 200:
-                alerts = response.json()
+def iter_targets(project_data):
+    """Yields the organizations and repositories of a project, organizations first, in the order they are defined in project_data.
 
-                if not alerts:
-                    break
+    Args:
+        project_data (Project): The owner, organizations, and repositories of the project.
 
-                alerts_count(alerts, sev_counts)
-                scan_alerts.extend(alerts)
-                page_no += 1
-            else:
-                print(api_error_response(response))
-                break
+    Yields:
+        tuple: A (gh_entity, gh_name, location) tuple, where gh_entity is either 'organizations' or 'repositories', and location holds the
+               organization, or the owner and repository, as keyword arguments for get_alerts_url and the functions using it.
+    """
+    for org_name in project_data.organizations:
+        yield 'organizations', org_name, {'org_name': org_name}
 
-    elif call_func in ['secretscan', 'dependabot']:
-        url = f"{base_url}?per_page=100{state_query}"
+    for repo_name in project_data.repositories:
+        yield 'repositories', repo_name, {'owner': project_data.owner, 'repo_name': repo_name}
 
-        while url:
-            response = requests.get(url, headers=headers)
+def get_owner_org(project_data):
+    """Return the organization of a project that owns its repositories, if the owner is one of the project's organizations.
 
-            if response.status_code == 200:
-                alerts = response.json()
+    Args:
+        project_data (Project): The owner, organizations, and repositories of the project.
 
-                if not alerts:
-                    break
+    Returns:
+        str: The name of the organization as defined in project_data, or None if the owner isn't one of the project's organizations.
+    """
+    owner = (project_data.owner or '').lower()
+    return next((org_name for org_name in project_data.organizations if org_name.lower() == owner), None)
 
-                alerts_count(alerts, sev_counts)
-                scan_alerts.extend(alerts)
+def get_repo_alerts(org_alerts, repo_name, call_func):
+    """Derive the alerts of a repository from the alerts retrieved for the organization that owns it, without requesting them again.
 
-                # Get the next page URL from the 'Link' header if present
-                link_header = response.headers.get('Link')
-                url = get_next_page_link(link_header)
-            else:
-                print(api_error_response(response))
-                break
+    Args:
+        org_alerts (list): The alerts of the organization, as returned by get_scan_alerts.
+        repo_name (str): The name of the repository.
+        call_func (str): The type of scan alerts ('codescan', 'secretscan', 'dependabot').
+
+    Returns:
+        tuple: A tuple containing a list of scan_alerts and a list of severity counts (sev_list), like get_scan_alerts.
+    """
+    repo_name = repo_name.lower()
+    scan_alerts = [alert for alert in org_alerts if (alert.get('repository') or {}).get('name', '').lower() == repo_name]
+    return scan_alerts, count_alerts(scan_alerts, call_func)
+
+def get_owned_repo_alerts(session, api_url, org_future, call_func, owner, repo_name, state=None, cache=None):
+    """Derive the alerts of a repository from the alerts of the organization that owns it, or retrieve them for the repository if that fails.
+
+    The organization alerts may fail even though the repository alerts can be retrieved, for example if the API key has access to the
+    repositories but not to the security alerts of the organization.
 
-    sev_list = [val for val in sev_counts.values()]
-    sev_list.insert(0, open_alert_count)
+    Args:
+        session (requests.Session): The session used for making requests to the GitHub API.
+        api_url (str): The base URL for the GitHub API.
+        org_future (Future): The future holding the result of get_scan_alerts for the organization.
+        call_func (str): The type of scan alerts ('codescan', 'secretscan', 'dependabot').
+        owner (str): The name of the repository owner.
+        repo_name (str): The name of the repository.
+        state (str, optional): The state of the alerts to retrieve, if they are retrieved for the repository. Defaults to None.
+        cache (dict, optional): The response cache returned by load_cache. Defaults to None (no caching).
+
+    Returns:
+        tuple: A tuple containing a list of scan_alerts and a list of severity counts (sev_list), like get_scan_alerts.
+    """
+    try:
+        org_alerts = org_future.result()[0]
+    except AuthenticationError:
+        raise
+    except Exception:
+        return get_scan_alerts(session, api_url, call_func=call_func, owner=owner, repo_name=repo_name, state=state, cache=cache)
 
-    return scan_alerts, sev_list
+    return get_repo_alerts(org_alerts, repo_name, call_func)
 
-def process_alerts_count(api_url, project_data, selected_scans):
+def process_alerts_count(session, api_url, project_data, selected_scans, project_alerts=None, cache=None):
     """Processes and retrieves the alert count for each scan type (Code Scan, Secret Scan, Dependabot Scan)
        for the specified organizations and repositories.
 
     Description:
-        The function iterates through the organizations and repositories provided in the project_data dictionary and retrieves the alert count
-        for each scan type (Code Scan, Secret Scan, Dependabot Scan). It then appends the alert count for each organization or repository along
-        with the corresponding scan type to a list.
+        The function iterates through the organizations and repositories provided in project_data and retrieves the alert count
+        for each scan type (Code Scan, Secret Scan, Dependabot Scan) concurrently, using up to MAX_WORKERS threads. It then appends the alert count for each organization or repository along
+        with the corresponding scan type to a list. If the alerts were already retrieved for the scan reports, the alert count is derived from them
+        without any further requests. Otherwise, only open alerts are retrieved, Secret Scan alerts are counted without downloading them, as they
+        have no severity levels, and Dependabot alerts of repositories are counted with a single GraphQL query that only selects their severity.
+        If the repositories are owned by one of the project's organizations, the Code Scan and Dependabot alert counts of the repositories are
+        derived from the open alerts retrieved for the organization, instead of retrieving the alerts of every repository separately, unless the
+        alerts of the organization could not be retrieved.
 
     Args:
+        session (requests.Session): The session used for making requests to the GitHub API.
         api_url (str): The API URL to retrieve scan data.
-        project_data (dict): A dictionary containing project data, including organizations, repositories, and owner (if repositories are specified).
+        project_data (Project): The owner (if repositories are specified), organizations, and repositories of the project.
+        selected_scans (dict): A dictionary mapping the scan labels to the scan types to retrieve the alert count for.
+        project_alerts (dict, optional): The alerts already retrieved by fetch_project_alerts. Defaults to None.
+        cache (dict, optional): The response cache returned by load_cache. Defaults to None (no caching).
 
     Returns:
         dict: A dictionary containing the raw alert count data and the processed alert count data as lists.
     """
     alert_count = []
-   
-    for gh_entity in ['organizations', 'repositories']:
-        for gh_name in project_data.get(gh_entity, []):
-            if gh_name:
-                try:
-                    for scan_label, call_func in selected_scans.items():
-                        if gh_entity == 'organizations':
-                            sev_list = get_scan_alerts(api_url, org_name=gh_name, call_func=call_func)[1]
-                        elif gh_entity == 'repositories':
-                            owner = project_data.get('owner')
-                            sev_list = get_scan_alerts(api_url, owner=owner, repo_name=gh_name, call_func=call_func)[1]
-
-                        row = [gh_name if gh_entity == 'organizations' else '', gh_name if gh_entity == 'repositories' else '', scan_label, *sev_list]
-                        alert_count.append(row)
-                except Exception as e:
-                    print(f"Error getting alert count for {'repository' if gh_entity == 'repositories' else 'organization'}: {gh_name} - {e}")
+    owner = project_data.owner
+    owner_org = get_owner_org(project_data)
+
+    def get_sev_list(gh_entity, gh_name, location, call_func):
+        """Retrieves the open alert count and the severity counts for an organization or repository.
+
+        Args:
+            gh_entity (str): Either 'organizations' or 'repositories'.
+            gh_name (str): The name of the organization or repository.
+            location (dict): The organization, or the owner and repository, as yielded by iter_targets.
+            call_func (str): The type of scan alerts ('codescan', 'secretscan', 'dependabot').
+
+        Returns:
+            list: The open alert count followed by the count for each severity level.
+        """
+        # Derive the alert count from the alerts retrieved for the scan reports, if available
+        if project_alerts and (gh_entity, gh_name, call_func) in project_alerts:
+            return project_alerts[(gh_entity, gh_name, call_func)].result()[1]
+
+        # Derive the alert count from the open alerts of the organization that owns the repositories, if retrieved
+        if call_func in org_alerts:
+            if gh_entity == 'organizations' and gh_name == owner_org:
+                return org_alerts[call_func].result()[1]
+            if gh_entity == 'repositories':
+                return get_owned_repo_alerts(session, api_url, org_alerts[call_func], call_func, state='open', cache=cache, **location)[1]
+
+        # Use the Dependabot alert count retrieved with GraphQL, if available
+        if call_func == 'dependabot' and gh_entity == 'repositories' and gh_name in graphql_counts.result():
+            return graphql_counts.result()[gh_name]
+
+        # Secret scanning alerts have no severity levels, so the alerts don't need to be downloaded to count them
+        if call_func == 'secretscan':
+            open_alert_count = get_open_alert_count(session, api_url, call_func, cache=cache, **location)
+            if open_alert_count is not None:
+                return [open_alert_count] + [0] * len(SEVERITY_LEVELS)
+
+        return get_scan_alerts(session, api_url, call_func=call_func, state='open', cache=cache, **location)[1]
+
+    # Build the list of organizations and repositories, and the scan types to retrieve the alert count for
+    targets = [(gh_entity, gh_name, location, scan_label, call_func) for gh_entity, gh_name, location in iter_targets(project_data) for scan_label, call_func in selected_scans.items()]
+
+    # Scan types for which repository alert counts can be derived from the open alerts of the owning organization, if not already retrieved
+    org_scans = [call_func for call_func in ['codescan', 'dependabot'] if owner_org and call_func in selected_scans.values() and ('organizations', owner_org, call_func) not in (project_alerts or {})]
+
+    # Repositories for which the Dependabot alert count isn't derived from already retrieved alerts are counted with a single GraphQL query
+    graphql_repos = [gh_name for gh_entity, gh_name, location, scan_label, call_func in targets if gh_entity == 'repositories' and call_func == 'dependabot' and call_func not in org_scans and (gh_entity, gh_name, call_func) not in (project_alerts or {})]
+
+    # Retrieve the alerts for all organizations, repositories and scan types concurrently, starting with the queries the others may wait for
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        org_alerts = {call_func: executor.submit(get_scan_alerts, session, api_url, org_name=owner_org, call_func=call_func, state='open', cache=cache) for call_func in org_scans}
+        graphql_counts = executor.submit(get_dependabot_alert_counts, session, api_url, owner, graphql_repos) if graphql_repos else executor.submit(dict)
+        futures = [executor.submit(get_sev_list, gh_entity, gh_name, location, call_func) for gh_entity, gh_name, location, scan_label, call_func in targets]
+
+    # Add the alert count rows in the same order as the targets were defined
+    for (gh_entity, gh_name, location, scan_label, call_func), future in zip(targets, futures):
+        try:
+            sev_list = future.result()
+            row = [gh_name if gh_entity == 'organizations' else '', gh_name if gh_entity == 'repositories' else '', scan_label, *sev_list]
+            alert_count.append(row)
+        except AuthenticationError:
+            raise
+        except Exception as e:
+            print_status(f"Error getting alert count for {'repository' if gh_entity == 'repositories' else 'organization'}: {gh_name} - {e}")
 
     return {'raw_alerts': alert_count, 'scan_alerts': alert_count}
 
@@ -309,6 +1045,8 @@ def get_theme(output_theme):
         'orange': {'header_fill_color': 'F79646', 'odd_row_fill_color': 'FDE9D9', 'border_color': 'FABF8F'}
     }
 
+    from openpyxl.styles import PatternFill, Font, Border, Side, Alignment
+
     settings = theme_settings.get(output_theme, theme_settings['grey'])
 
     theme = {
@@ -338,7 +1076,7 @@ def write_xlsx(header_row, alert_data, project_name, filepath, call_func, output
     of the output file. The output theme variable can be used to specify the color of the output file.
 
     Args:
-        header_row (list): A list of column header labels for the XLSX file.
+        header_row (tuple): The column header labels for the XLSX file.
         alert_data (dict): A dictionary containing the alert data to be written to the XLSX file.
         project_name (str): The name of the project for which the alert data is being written.
         filepath (str): The full file path where the XLSX file will be saved.
@@ -348,6 +1086,9 @@ def write_xlsx(header_row, alert_data, project_name, filepath, call_func, output
     Returns:
         None
     """
+    import openpyxl
+    from openpyxl.styles import PatternFill, Font, Border, Side
+
     # Call the get_theme function and store the returned theme dictionary
     theme = get_theme(output_theme)
 
@@ -375,6 +1116,9 @@ def write_xlsx(header_row, alert_data, project_name, filepath, call_func, output
         default_sheet = wb["Sheet"]
         wb.remove(default_sheet)
 
+    # Track the length of the longest value of each column while the rows are written, to autosize the columns afterwards
+    column_lengths = [len(str(col_data)) for col_data in header_row]
+
     for col_num, col_data in enumerate(header_row):
         cell = ws.cell(row=1, column=col_num + 1, value=col_data)
         cell.fill = header_fill
@@ -385,11 +1129,17 @@ def write_xlsx(header_row, alert_data, project_name, filepath, call_func, output
     # Set filter on the header row
     ws.auto_filter.ref = f"A1:{openpyxl.utils.get_column_letter(len(header_row))}1"
 
-    # Write the data rows and apply alternate row colors
+    # Set this flag to True if the current sheet contains URLs
+    contains_urls = True  # Change this value based on your sheet's content
+
+    # Assuming the last column contains URLs, add hyperlinks to it
+    url_column = len(header_row) if call_func != 'alert_count' and contains_urls else None  # Change this value if the URL column is not the last one
+
+    # Write the data rows as they are generated and apply alternate row colors, so the rows don't have to be held in memory first
     for row_num, row_data in enumerate(alert_data['scan_alerts'], start=2):
         row_fill = odd_row_fill if row_num % 2 == 0 else even_row_fill
-        for col_num, col_data in enumerate(row_data):
-            cell = ws.cell(row=row_num, column=col_num + 1, value=col_data)
+        for col_num, col_data in enumerate(row_data, start=1):
+            cell = ws.cell(row=row_num, column=col_num, value=col_data)
 
             # Check if the cell value is zero, then set the data type to 'n' (number)
             if col_data == '0':
@@ -400,23 +1150,17 @@ def write_xlsx(header_row, alert_data, project_name, filepath, call_func, output
             cell.border = thin_border
             cell.alignment = cell_alignment
 
-    # Set this flag to True if the current sheet contains URLs
-    contains_urls = True  # Change this value based on your sheet's content
-
-    if call_func != 'alert_count' and contains_urls:
-        # Assuming the last column contains URLs, loop through the rows and add hyperlinks
-        url_column = len(header_row)  # Change this value if the URL column is not the last one
-        for row_num in range(2, len(alert_data['scan_alerts']) + 2):
-            cell = ws.cell(row=row_num, column=url_column)
-            url = cell.value
-            if url:
+            if col_num == url_column and col_data:
                 try:
                     # Add the friendly name as the URL itself
-                    cell.value = f'=HYPERLINK("{url}", "{url}")'
+                    cell.value = f'=HYPERLINK("{col_data}", "{col_data}")'
                     cell.font = hyperlink_style
                     cell.alignment = hyperlink_alignment
                 except Exception as e:
-                        print(f"Error while processing hyperlink at row {row_num}: {e}")
+                        print_status(f"Error while processing hyperlink at row {row_num}: {e}")
+
+            if col_num <= len(column_lengths):
+                column_lengths[col_num - 1] = max(column_lengths[col_num - 1], len(str(cell.value)))
 
     if call_func == 'alert_count':
         # Calculate the total for each column in the first worksheet
@@ -429,6 +1173,7 @@ def write_xlsx(header_row, alert_data, project_name, filepath, call_func, output
                      bottom=Side(style='medium', color=theme['thin_border'].bottom.color))
         white_fill = PatternFill(start_color='FFFFFF', end_color='FFFFFF', fill_type='solid')
         first_ws.cell(row=last_row + 1, column=1, value="Total").font = bold_font
+        column_lengths[0] = max(column_lengths[0], len("Total"))
 
         # Loop through the columns and calculate the total
         for col_num in range(4, 12):  # Columns D-K (4-11)
@@ -436,6 +1181,7 @@ def write_xlsx(header_row, alert_data, project_name, filepath, call_func, output
             column_total = sum(first_ws.cell(row=row_num, column=col_num).value for row_num in range(2, last_row + 1))
             cell = first_ws[f"{column_letter}{last_row + 1}"]
             cell.value = column_total
+            column_lengths[col_num - 1] = max(column_lengths[col_num - 1], len(str(column_total)))
         
         for col_num in range (1, 12):
             cell = first_ws.cell(row=last_row + 1, column=col_num)
@@ -451,16 +1197,10 @@ def write_xlsx(header_row, alert_data, project_name, filepath, call_func, output
     
     # Autosize column width
     for col_num, col_data in enumerate(header_row, start=1):
-        max_length = 0
         column_letter = openpyxl.utils.get_column_letter(col_num)
 
-        for row_num in range(1, len(alert_data['scan_alerts']) + 3):  # +3 to include header and one extra row for safety
-            cell_value = str(ws.cell(row=row_num, column=col_num).value)
-            cell_length = len(cell_value)
-            max_length = max(max_length, cell_length)
-
         # Limit the maximum column width to the specified maximum cell length
-        max_length = min(max_length, max_cell_length)
+        max_length = min(column_lengths[col_num - 1], max_cell_length)
 
         # Set the column width
         ws.column_dimensions[column_letter].width = max_length + padding
@@ -476,15 +1216,18 @@ def write_xlsx(header_row, alert_data, project_name, filepath, call_func, output
 
     # Save workbook
     wb.save(filepath)
-    print(f"Wrote {call_func} for \"{project_name}\" to {filepath}")
+    print_status(f"Wrote {call_func} for \"{project_name}\" to {filepath}")
 
-def write_alerts(alert_data, project_name, output_type=None, output_theme=None, report_dir='', call_func=None, time_stamp=None):
+def write_alerts(alert_data, project_name, output_type=None, output_theme=None, report_dir='', call_func=None, time_stamp=None, compress=False):
     """Writes the processed scan alert data to a file in the specified format (CSV, XLSX, or JSON).
 
     Description:
         The function writes the processed scan alert data to a file in the specified output format (CSV, XLSX, or JSON).
-        It sets the column headers for the CSV file depending on the type of alert. If the output type is not specified, it defaults to 'csv'.
+        It takes the column headers from REPORT_HEADERS depending on the type of alert and writes them before the alert rows. If the output type is not specified, it defaults to 'csv'.
         The function creates a file path based on the report directory, project name, alert type, and the current date and time.
+        If compress is set, CSV and JSON files are compressed with gzip at the fastest compression level, which still shrinks the repetitive report data considerably.
+        JSON files are encoded in a single call and written at once, instead of writing each element separately as json.dump does. They are
+        always encoded with the json module, so the reports are the same whether or not orjson is installed.
 
     Args:
         alert_data (dict): A dictionary containing processed alert data.
@@ -492,6 +1235,7 @@ def write_alerts(alert_data, project_name, output_type=None, output_theme=None,
         output_type (str, optional): The output format for the alert data file; either 'csv' or 'json'. Defaults to 'csv'.
         report_dir (str, optional): The directory where the report file should be saved. Defaults to an empty string, which means the file will be saved in a folder named after the current date.
         call_func (str, optional): The function to be called for processing alerts; either 'codescan', 'secretscan', or 'dependabot'. Defaults to None.
+        compress (bool, optional): Whether to compress CSV and JSON files with gzip and add the ".gz" extension. Defaults to False.
 
     Raises:
         SystemExit: If there's an error writing to the file.
@@ -505,36 +1249,61 @@ def write_alerts(alert_data, project_name, output_type=None, output_theme=None,
     else:
         filepath = os.path.join(report_dir, f"{datetime.now().strftime('%Y%m%d')}", f"{project_name}-{scan_type}-{time_stamp}.{output_type}")
 
+    # Add the gzip extension if the CSV and JSON files are compressed
+    if compress and output_type != 'xlsx':
+        filepath += '.gz'
+
     os.makedirs(os.path.dirname(filepath), exist_ok=True)
    
-    # Set the column headers for the CSV file depending on the type of alert
-    scan_options = {
-        'alert_count': ['Organization', 'Repository', 'Scan Type', 'Total Alerts', 'Critical', 'High', 'Medium', 'Low', 'Warning', 'Note', 'Error'],
-        'code_scan': ['Alert', 'Organization', 'Repository', 'Date Created', 'Date Updated', 'Days Open', 'Severity', 'State', 'Rule ID', 'Description', 'Category', 'File', 'Fixed At', 'Dismissed At', 'Dismissed By', 'Dismissed Reason', 'Dismissed Comment', 'Tool', 'GitHub URL'],
-        'secret_scan': ['Alert', 'Organization', 'Repository', 'Date Created', 'Date Updated', 'Days Open', 'State', 'Resolved At', 'Resolved By', 'Resolved Reason', 'Secret Type Name', 'Secret Type', 'GitHub URL'],
-        'dependabot_scan': ['Alert', 'Organization', 'Repository', 'Date Created', 'Date Updated', 'Days Open', 'Severity', 'State', 'Package Name', 'CVE ID', 'Summary', 'Fixed At', 'Dismissed At', 'Dismissed By', 'Dismissed Reason', 'Dismissed Comment', 'Scope', 'Manifest ID', 'GitHub URL']
-    }
-
     # Set the header row
-    header_row = scan_options.get(call_func, [])
+    header_row = REPORT_HEADERS.get(call_func, ())
     
     # Write the alert data to a file in the specified format, if none is specified, default to CSV
     if output_type == 'xlsx':
         write_xlsx(header_row, alert_data, project_name, filepath, call_func, output_theme)
     else:
         try:
-            with open(filepath, 'w', encoding='utf-8', newline='') as f:
-                writer = csv.writer(f) if output_type == 'csv' else None
-                if output_type == 'json':
-                    json.dump(alert_data['raw_alerts'], f, indent=4)
-                    print(f"Wrote {call_func} for \"{project_name}\" to {filepath}")
-                elif output_type == 'csv':
-                    writer.writerow(header_row)
-                    writer.writerows(alert_data['scan_alerts'])
-                    print(f"Wrote {call_func} for \"{project_name}\" to {filepath}")
+            if output_type == 'json':
+                with (gzip.GzipFile(filepath, 'wb', compresslevel=1) if compress else open(filepath, 'wb')) as f:
+                    f.write(json.dumps(alert_data['raw_alerts'], indent=4).encode('utf-8'))
+                    print_status(f"Wrote {call_func} for \"{project_name}\" to {filepath}")
+            elif output_type == 'csv':
+                with (io.TextIOWrapper(io.BufferedWriter(gzip.GzipFile(filepath, 'wb', compresslevel=1), WRITE_BUFFER_SIZE), encoding='utf-8', newline='') if compress else open(filepath, 'w', encoding='utf-8', newline='', buffering=WRITE_BUFFER_SIZE)) as f:
+                    write_csv_rows(f, (header_row,))
+                    write_csv_rows(f, alert_data['scan_alerts'])
+                    print_status(f"Wrote {call_func} for \"{project_name}\" to {filepath}")
         except IOError as e:
             raise SystemExit(f"Error writing to {e.filename}: {e}")
 
+def write_csv_rows(f, rows):
+    """Write rows to a CSV file, quoting every field.
+
+    Quoting every field and doubling the quotes inside it is valid CSV for any value, so the rows can be joined and
+    written directly, which is faster than checking each field for characters that require quoting, as csv.writer does.
+    Like csv.writer, empty values are written for None, and the lines are terminated with CRLF.
+
+    Args:
+        f (file): The file object to write to, opened in text mode with newline=''.
+        rows (iterable): The rows to write, each a list of values.
+    """
+    write = f.write
+    for row in rows:
+        write('"' + '","'.join('' if value is None else str(value).replace('"', '""') for value in row) + '"\r\n')
+
+def format_date(timestamp):
+    """Formats an ISO 8601 timestamp from the GitHub API as a date.
+
+    GitHub API timestamps always start with the date in the "YYYY-MM-DD" format, so the date is sliced from the
+    timestamp instead of parsing and reformatting it for every alert.
+
+    Args:
+        timestamp (str): The timestamp, e.g. "2024-10-06T12:00:00Z", or an empty string.
+
+    Returns:
+        str: The date, e.g. "2024-10-06", or an empty string if no timestamp is given.
+    """
+    return timestamp[:10] if timestamp else ''
+
 def safe_get(alert, keys, default=''):
     """Safely retrieves the value from a nested dictionary using a list of keys.
 
@@ -556,115 +1325,261 @@ def safe_get(alert, keys, default=''):
     
     return default if result is None else result
 
-def process_scan_alerts(api_url, project_data, call_func, output_type=None ,state=None):
-    """Retrieves and processes scan alerts from GitHub organizations and repositories.
+def days_open(created_at, now):
+    """Returns the number of days since an alert was created.
+
+    The timestamp is always in the "YYYY-MM-DDTHH:MM:SSZ" format, so its fields are sliced from fixed positions, which is
+    considerably faster than parsing it with datetime.strptime for every alert.
+
+    Args:
+        created_at (str): The creation timestamp of the alert.
+        now (datetime): The current time.
+
+    Returns:
+        int: The number of full days since the alert was created, or an empty string if the timestamp is empty.
+    """
+    if not created_at:
+        return ''
+
+    created = datetime(int(created_at[0:4]), int(created_at[5:7]), int(created_at[8:10]), int(created_at[11:13]), int(created_at[14:16]), int(created_at[17:19]))
+    return (now - created).days
+
+def field_getter(*keys, date=False):
+    """Creates a function that retrieves a value from a nested alert dictionary along a fixed path of keys.
+
+    The key path is resolved once when the function is created, so retrieving the value for each alert doesn't loop over
+    the keys like safe_get. Missing keys, or keys with a null value, result in an empty string.
+
+    Args:
+        *keys (str): The keys to traverse the alert dictionary, e.g. 'rule', 'id'.
+        date (bool, optional): Format the retrieved timestamp as a date using format_date. Defaults to False.
+
+    Returns:
+        function: A function that takes an alert dictionary and returns the value.
+    """
+    if len(keys) == 1:
+        key, = keys
+        def get_value(alert):
+            return alert.get(key)
+    elif len(keys) == 2:
+        key1, key2 = keys
+        def get_value(alert):
+            return (alert.get(key1) or {}).get(key2)
+    elif len(keys) == 3:
+        key1, key2, key3 = keys
+        def get_value(alert):
+            return ((alert.get(key1) or {}).get(key2) or {}).get(key3)
+    else:
+        def get_value(alert):
+            return safe_get(alert, keys, None)
+
+    def get_field(alert):
+        value = get_value(alert)
+        if date:
+            return format_date(value)
+        return '' if value is None else value
+
+    return get_field
+
+def codescan_severity(alert):
+    """Returns the security severity level of a Code Scanning alert, or the rule severity if there is none."""
+    return safe_get(alert, ['rule', 'security_severity_level']) or safe_get(alert, ['rule', 'severity'], '')
+
+def codescan_tool(alert):
+    """Returns the name and version of the tool that created a Code Scanning alert."""
+    return safe_get(alert, ['tool', 'name'], '') + ' ' + safe_get(alert, ['tool', 'version'], '')
+
+# Field extractors for the report columns of each scan type, following the columns common to all scan types
+SCAN_ALERT_FIELDS = {
+    'codescan': (
+        codescan_severity,
+        field_getter('state'),
+        field_getter('rule', 'id'),
+        field_getter('most_recent_instance', 'message', 'text'),
+        field_getter('most_recent_instance', 'category'),
+        field_getter('most_recent_instance', 'location', 'path'),
+        field_getter('fixed_at', date=True),
+        field_getter('dismissed_at', date=True),
+        field_getter('dismissed_by', 'login'),
+        field_getter('dismissed_reason'),
+        field_getter('dismissed_comment'),
+        codescan_tool,
+        field_getter('html_url')
+    ),
+    'secretscan': (
+        field_getter('state'),
+        field_getter('resolved_at', date=True),
+        field_getter('resolved_by', 'login'),
+        field_getter('resolution'),
+        field_getter('secret_type_display_name'),
+        field_getter('secret_type'),
+        field_getter('html_url')
+    ),
+    'dependabot': (
+        field_getter('security_advisory', 'severity'),
+        field_getter('state'),
+        field_getter('dependency', 'package', 'name'),
+        field_getter('security_advisory', 'cve_id'),
+        field_getter('security_advisory', 'summary'),
+        field_getter('fixed_at', date=True),
+        field_getter('dismissed_at', date=True),
+        field_getter('dismissed_by', 'login'),
+        field_getter('dismissed_reason'),
+        field_getter('dismissed_comment'),
+        field_getter('dependency', 'scope'),
+        field_getter('dependency', 'manifest_path'),
+        field_getter('html_url')
+    )
+}
+
+def fetch_project_alerts(session, api_url, project_data, scans, state=None, cache=None, fetched_alerts=None):
+    """Retrieves the scan alerts of all organizations and repositories of a project.
 
     Description:
-        The function iterates through each organization and repository, retrieves the corresponding scan alerts, processes them, and adds the processed alerts
-        to a list. If output_type is set to 'json', the function returns raw alerts and skips further processing. The alerts are processed depending on the
-        call_func parameter, which can be 'codescan', 'secretscan', or 'dependabot'. The function returns a dictionary containing the raw alerts and the processed
-        scan alerts.
+        The function retrieves the alerts for every combination of organization or repository and scan type concurrently, using up to MAX_WORKERS
+        threads. The alerts are retrieved once per project, and then shared by the Alert Count report and all scan reports and output types.
+        The function returns without waiting for the alerts, so the reports of one scan type can be written while other alerts are retrieved.
+        If the repositories are owned by one of the project's organizations, their alerts are derived from the alerts retrieved for the
+        organization, as the organization alerts already include the alerts of all its repositories. If the alerts of the organization cannot be
+        retrieved, the alerts of the repositories are retrieved separately instead. If an organization or repository is part of
+        multiple projects, its alerts are retrieved by the first project and reused by the others through fetched_alerts.
 
     Args:
+        session (requests.Session): The session used for making requests to the GitHub API.
         api_url (str): The base API URL for GitHub.
-        project_data (dict): A dictionary containing project information such as owner, organizations, and repositories.
+        project_data (Project): The owner, organizations, and repositories of the project.
+        scans (list): The scan types to retrieve alerts for; any of 'codescan', 'secretscan', and 'dependabot'.
+        state (str, optional): Filter alerts based on their state, defaults to None.
+        cache (dict, optional): The response cache returned by load_cache. Defaults to None (no caching).
+        fetched_alerts (dict, optional): The alerts retrieved for all projects so far, shared by all calls of a run. Defaults to None.
+
+    Returns:
+        dict: A dictionary mapping (gh_entity, gh_name, call_func) tuples to futures holding the result of get_scan_alerts, in the same
+              order as the organizations and repositories are defined in project_data.
+    """
+    owner_org = get_owner_org(project_data)
+    project_alerts = {}
+    fetched_alerts = {} if fetched_alerts is None else fetched_alerts
+
+    # Build the list of organizations, repositories and scan types to retrieve alerts for
+    targets = [(gh_entity, gh_name, location, call_func) for gh_entity, gh_name, location in iter_targets(project_data) for call_func in scans]
+
+    # Retrieve the alerts for all organizations, repositories and scan types concurrently. The organizations are submitted first, so the
+    # repositories owned by one of them can wait for its alerts and filter them. Alerts already retrieved for another project are reused
+    executor = ThreadPoolExecutor(max_workers=MAX_WORKERS)
+
+    with fetched_alerts_lock:
+        for gh_entity, gh_name, location, call_func in targets:
+            fetched_key = (gh_entity, location.get('owner'), gh_name, call_func)
+
+            if fetched_key in fetched_alerts:
+                project_alerts[(gh_entity, gh_name, call_func)] = fetched_alerts[fetched_key]
+            elif gh_entity == 'repositories' and owner_org:
+                org_future = project_alerts[('organizations', owner_org, call_func)]
+                project_alerts[(gh_entity, gh_name, call_func)] = executor.submit(get_owned_repo_alerts, session, api_url, org_future, call_func, state=state, cache=cache, **location)
+            else:
+                project_alerts[(gh_entity, gh_name, call_func)] = executor.submit(get_scan_alerts, session, api_url, call_func=call_func, state=state, cache=cache, **location)
+
+            fetched_alerts[fetched_key] = project_alerts[(gh_entity, gh_name, call_func)]
+
+    # Don't wait for the alerts to be retrieved, so the reports can be written as soon as the alerts they need are available, while the
+    # remaining alerts are still being retrieved. The threads exit once all alerts have been retrieved
+    executor.shutdown(wait=False)
+
+    return project_alerts
+
+def process_scan_alerts(project_alerts, call_func, output_type=None):
+    """Processes the scan alerts retrieved from GitHub organizations and repositories.
+
+    Description:
+        The function selects the alerts of the given scan type from the alerts retrieved by fetch_project_alerts. If output_type is set to 'json',
+        the function returns raw alerts and skips further processing. Otherwise, the alerts are processed by the iter_scan_alerts generator depending
+        on the call_func parameter, which can be 'codescan', 'secretscan', or 'dependabot', so each row is only created when the report is written.
+        The function returns a dictionary containing the raw alerts and the processed scan alerts.
+
+    Args:
+        project_alerts (dict): The alerts of the project, as returned by fetch_project_alerts.
         call_func (str): The function to be called for processing alerts; either 'codescan', 'secretscan', or 'dependabot'.
         output_type (str, optional): The output type for raw alerts, defaults to None. If 'json', the function returns raw alerts and skips further processing.
-        state (str, optional): Filter alerts based on their state, defaults to None.
 
     Returns:
-        dict: A dictionary containing raw_alerts and processed scan_alerts.
+        dict: A dictionary containing raw_alerts and processed scan_alerts, where scan_alerts is a generator of rows.
     """
     raw_alerts = []
-    scan_alerts = []
+    results = [(gh_entity, gh_name, future) for (gh_entity, gh_name, scan), future in project_alerts.items() if scan == call_func]
 
-    # Iterate through each organization and repository and get the alerts
-    for gh_entity in ['organizations', 'repositories']:
-        for gh_name in project_data.get(gh_entity, []):
-            if gh_name:
-                try:
-                    owner = project_data.get('owner') if gh_entity == 'repositories' else None
-                    alerts = get_scan_alerts(api_url, owner=owner, org_name=gh_name, call_func=call_func, state=state, repo_name=gh_name if gh_entity == 'repositories' else None)[0]
-
-                    # If the output type is json return the raw alerts and ignore the rest of the function
-                    if output_type == 'json':
-                        raw_alerts = alerts
-                        return({'raw_alerts': raw_alerts})
-
-                    # Process alerts for each organization and repository and add them to a list
-                    for alert in alerts:
-                        # Get the days open since the alert was created
-                        days_since_created = (datetime.now() - datetime.strptime(safe_get(alert, ['created_at']), '%Y-%m-%dT%H:%M:%SZ')).days if safe_get(alert, ['created_at']) != '' else ''
-                        
-                        # Add default values for all alert types to the list
-                        alert_data = [
-                            safe_get(alert, ['number']),
-                            gh_name if gh_entity == 'organizations' else safe_get(alert, ['organization', 'name'], ''),
-                            gh_name if gh_entity == 'repositories' else safe_get(alert, ['repository', 'name'], ''),
-                            datetime.strptime(safe_get(alert, ['created_at']), '%Y-%m-%dT%H:%M:%SZ').strftime('%Y-%m-%d') if safe_get(alert, ['created_at']) != '' else '',
-                            datetime.strptime(safe_get(alert, ['updated_at']), '%Y-%m-%dT%H:%M:%SZ').strftime('%Y-%m-%d') if safe_get(alert, ['updated_at']) != '' else '',
-                            days_since_created if safe_get(alert, ['state']) == 'open' else '0'
-                        ]
-
-                        # Add Code Scanning alert data to the list
-                        if call_func == 'codescan':
-                            alert_data.extend([
-                                safe_get(alert, ['rule', 'security_severity_level']) or safe_get(alert, ['rule', 'severity'], ''),
-                                safe_get(alert, ['state'], ''),
-                                safe_get(alert, ['rule', 'id'], ''),
-                                safe_get(alert, ['most_recent_instance', 'message', 'text'], ''),
-                                safe_get(alert, ['most_recent_instance', 'category'], ''),
-                                safe_get(alert, ['most_recent_instance', 'location', 'path'], ''),
-                                datetime.strptime(safe_get(alert, ['fixed_at']), '%Y-%m-%dT%H:%M:%SZ').strftime('%Y-%m-%d') if safe_get(alert, ['fixed_at']) != '' else '',
-                                datetime.strptime(safe_get(alert, ['dismissed_at']), '%Y-%m-%dT%H:%M:%SZ').strftime('%Y-%m-%d') if safe_get(alert, ['dismissed_at']) != '' else '',                               
-                                safe_get(alert, ['dismissed_by', 'login'], ''),
-                                safe_get(alert, ['dismissed_reason'], ''),
-                                safe_get(alert, ['dismissed_comment'], ''),
-                                safe_get(alert, ['tool', 'name'], '') + ' ' + safe_get(alert, ['tool', 'version'], ''),
-                                safe_get(alert, ['html_url'], '')
-                            ])
-                                
-                        # Add Secret Scanning alert data to the list
-                        elif call_func == 'secretscan':
-                            alert_data.extend([
-                                safe_get(alert, ['state'], ''),
-                                datetime.strptime(safe_get(alert, ['resolved_at']), '%Y-%m-%dT%H:%M:%SZ').strftime('%Y-%m-%d') if safe_get(alert, ['resolved_at']) != '' else '',
-                                safe_get(alert, ['resolved_by', 'login'], ''),
-                                safe_get(alert, ['resolution'], ''),
-                                safe_get(alert, ['secret_type_display_name'], ''),
-                                safe_get(alert, ['secret_type'], ''),
-                                safe_get(alert, ['html_url'], '')
-                            ])
-                
-                        # Add Dependabot alert data to the list
-                        elif call_func == 'dependabot':
-                            alert_data.extend([
-                                safe_get(alert, ['security_advisory', 'severity'], ''),
-                                safe_get(alert, ['state'], ''),
-                                safe_get(alert, ['dependency', 'package', 'name'], ''),
-                                safe_get(alert, ['security_advisory', 'cve_id'], ''),
-                                safe_get(alert, ['security_advisory', 'summary'], ''),
-                                datetime.strptime(safe_get(alert, ['fixed_at']), '%Y-%m-%dT%H:%M:%SZ').strftime('%Y-%m-%d') if safe_get(alert, ['fixed_at']) != '' else '',
-                                datetime.strptime(safe_get(alert, ['dismissed_at']), '%Y-%m-%dT%H:%M:%SZ').strftime('%Y-%m-%d') if safe_get(alert, ['dismissed_at']) != '' else '',
-                                safe_get(alert, ['dismissed_by', 'login'], ''),
-                                safe_get(alert, ['dismissed_reason'], ''),
-                                safe_get(alert, ['dismissed_comment'], ''),
-                                safe_get(alert, ['dependency', 'scope'], ''),
-                                safe_get(alert, ['dependency', 'manifest_path'], ''),
-                                safe_get(alert, ['html_url'], '')
-                            ])
-                        scan_alerts.append(alert_data)
-                except Exception as e:
-                    print(f"Error getting {call_func} alerts for {'repository' if gh_entity == 'repositories' else 'organization'}: {gh_name} - {e}")
-    
-    return {'raw_alerts': raw_alerts, 'scan_alerts': scan_alerts}
+    # If the output type is json return the raw alerts and skip further processing
+    if output_type == 'json':
+        for gh_entity, gh_name, future in results:
+            try:
+                raw_alerts.extend(future.result()[0])
+            except AuthenticationError:
+                raise
+            except Exception as e:
+                print_status(f"Error getting {call_func} alerts for {'repository' if gh_entity == 'repositories' else 'organization'}: {gh_name} - {e}")
+        return {'raw_alerts': raw_alerts}
+
+    return {'raw_alerts': raw_alerts, 'scan_alerts': iter_scan_alerts(results, call_func)}
+
+def iter_scan_alerts(results, call_func):
+    """Processes the retrieved scan alerts and yields them as report rows.
+
+    Description:
+        The function iterates through the results of each organization and repository in the order the targets were defined, and yields one
+        report row per alert. The rows are created on demand, so they can be written to the report file as they are generated, instead of
+        holding all rows in memory first. Errors retrieving the alerts for an organization or repository are printed and the alerts skipped, except authentication errors, which are raised.
+
+    Args:
+        results (list): A list of (gh_entity, gh_name, future) tuples, where each future holds the result of get_scan_alerts.
+        call_func (str): The type of scan alerts; either 'codescan', 'secretscan', or 'dependabot'.
+
+    Yields:
+        list: A report row for each alert.
+    """
+    # Get the field extractors for the scan type and the current time once, instead of for every alert
+    scan_fields = SCAN_ALERT_FIELDS[call_func]
+    now = datetime.now()
+
+    for gh_entity, gh_name, future in results:
+        try:
+            alerts = future.result()[0]
+
+            # Set the organization and repository columns once per organization or repository, if not set they are taken from each alert
+            org_name = gh_name if gh_entity == 'organizations' else None
+            repo_name = gh_name if gh_entity == 'repositories' else None
+
+            # Process the alerts for the organization or repository and yield them one row at a time
+            for alert in alerts:
+                created_at = safe_get(alert, ['created_at'])
+                state = safe_get(alert, ['state'])
+
+                # Get the days open since the alert was created, only open alerts need it
+                days_since_created = days_open(created_at, now) if state == 'open' else '0'
+
+                # Add default values for all alert types to the list
+                alert_data = [
+                    safe_get(alert, ['number']),
+                    org_name or safe_get(alert, ['organization', 'name'], ''),
+                    repo_name or safe_get(alert, ['repository', 'name'], ''),
+                    format_date(created_at),
+                    format_date(safe_get(alert, ['updated_at'])),
+                    days_since_created
+                ]
+
+                # Add the alert data of the scan type to the list
+                alert_data.extend([get_field(alert) for get_field in scan_fields])
+                yield alert_data
+        except AuthenticationError:
+            raise
+        except Exception as e:
+            print_status(f"Error getting {call_func} alerts for {'repository' if gh_entity == 'repositories' else 'organization'}: {gh_name} - {e}")
 
 def load_configuration(args):
     """Load the configuration and API key for making requests to the GitHub API.
 
     This function reads a configuration file and API key from the file system, optionally using
     command-line arguments to specify the file paths, and returns the parsed configuration and
-    headers for API requests. If the API key is encrypted, it will be decrypted using the
+    API key for API requests. If the API key is encrypted, it will be decrypted using the
     encryption key from the specified keyfile. If any required files are missing or the API key
     is corrupted, an error message will be displayed and the script will exit.
 
@@ -672,8 +1587,8 @@ def load_configuration(args):
     args (argparse.Namespace): The command-line arguments passed to the script.
 
     Returns:
-    tuple: A tuple containing the loaded configuration (as a dictionary) and headers
-    (as a dictionary) for making requests to the GitHub API.
+    tuple: A tuple containing the loaded configuration (as a dictionary) and the decrypted
+    API key (as a string) for making requests to the GitHub API.
 
     Raises:
     SystemExit: If the configuration file, keyfile, or API key is not found or if the
@@ -694,7 +1609,7 @@ def load_configuration(args):
     # Load configuration file and get API key from it if not specified as an environment variable
     try:
         with open(conf_file) as f:
-            config = json.load(f)
+            config = json_loads(f.read())
         if not api_key:
             api_key = config.get('connection', {}).get('gh_api_key', '')
     except FileNotFoundError as e:
@@ -721,6 +1636,8 @@ def load_configuration(args):
         except FileNotFoundError as e:
             raise SystemExit(f"Error loading {e.filename}: {e}\nYou might need to run the \"ghas_enc_key.py\" script first to generate a new \"{e.filename}\" file.")
         
+        from cryptography.fernet import Fernet
+
         try:
             fernet = Fernet(f_key)
             api_key = fernet.decrypt(api_key.encode()).decode()
@@ -728,13 +1645,7 @@ def load_configuration(args):
         except Exception :
             raise SystemExit(f"Error: Invalid key, your API key might be corrupted. Please run the \"ghas_enc_key.py\" script to encrypt the API key.") 
 
-    # Define headers for API requests to GitHub
-    headers = {
-        "Authorization": f"token {api_key}",
-        "X-GitHub-Api-Version": "2022-11-28" # API version number, see https://docs.github.com/en/rest/overview/api-versions
-    }
-
-    return config, headers
+    return config, api_key
 
 def setup_argparse():
     """Creates and returns an ArgumentParser object for the GitHub Advanced Security (GHAS) reporting tool.
@@ -783,6 +1694,7 @@ def setup_argparse():
     # Optional file format arguments
     output_format_group = parser.add_argument_group('Optional file format arguments')
     output_format_group.add_argument('-t', '--theme', metavar='<theme>', type=str, choices=['grey', 'blue', 'sakura', 'green', 'purple', 'aqua', 'orange'], default='grey', help='specify the color theme for "xlsx" file output. Valid keywords are "grey", "blue", "green", "sakura", "purple", "aqua", "orange". If none is specified, defaults to "grey".')
+    output_format_group.add_argument('-z', '--gzip', action='store_true', help='compress "csv" and "json" file output with gzip, and add the ".gz" extension to the file name')
 
     # Optional alert reports arguments
     alert_options_group = parser.add_argument_group('Optional alert report arguments')
@@ -796,6 +1708,14 @@ def setup_argparse():
     location_options_group.add_argument('-lk', '--keyfile', metavar='<PATH>', type=str, help='specify file location for the encryption key file (".ghas_env") - overrides the location specified in the configuration file')
     location_options_group.add_argument('-lr', '--reports', metavar='<PATH>', type=str, help='specify file location for the reports directory - overrides the location specified in the configuration file')
 
+    # Optional cache arguments
+    cache_options_group = parser.add_argument_group('Optional cache arguments')
+    cache_options_group.add_argument('-nc', '--no-cache', action='store_true', help='do not use or update the response cache (".ghas_cache.json"), which is stored in the configuration file location')
+
+    # Optional concurrency arguments
+    concurrency_options_group = parser.add_argument_group('Optional concurrency arguments')
+    concurrency_options_group.add_argument('-j', '--jobs', metavar='<N>', type=int, default=MAX_PROJECT_WORKERS, help=f'specify the number of projects processed concurrently. If none is specified, defaults to {MAX_PROJECT_WORKERS}')
+
     return parser
 
 def check_args_errors(args, parser):
@@ -836,6 +1756,9 @@ def check_args_errors(args, parser):
     elif args.owner and not (args.repo or args.org):
         parser.print_help()
         raise SystemExit('\nError: --owner requires --repo or --org to be specified.\n')
+    elif args.jobs < 1:
+        parser.print_help()
+        raise SystemExit('\nError: --jobs must be at least 1.\n')
 
 def process_args(parser):
     """Process the command-line arguments and execute the appropriate functions.
@@ -886,15 +1809,21 @@ def process_args(parser):
     # Get the theme color from the --theme flag, or default to 'grey'
     output_theme = args.theme
 
+    # Compress the CSV and JSON files if the -z, or --gzip flag is present
+    compress_output = args.gzip
+
     # Set state to 'open' if the -o ,or --open flag is present
     alert_state = 'open' if args.open else ''
 
-    # Call the load_configuration function to load the configuration file and assign the returned values to the config and headers variables 
-    global headers # Not too happy about this, but it's the only way I could get the headers variable to be accessible throughout the script
-    config, headers = load_configuration(args)
+    # Call the load_configuration function to load the configuration file and assign the returned values to the config and api_key variables 
+    config, api_key = load_configuration(args)
     api_url = config.get('connection', {}).get('gh_api_url', '') or "https://api.github.com"
     report_dir = args.reports or config.get('location', {}).get('reports', '')
     time_stamp = datetime.now().strftime('%Y%m%d%H%M%S')
+
+    # Load the response cache from the configuration file directory, unless the --no-cache flag is present
+    cache_dir = args.config or os.path.dirname(os.path.abspath(__file__))
+    cache = None if args.no_cache else load_cache(os.path.join(cache_dir, '.ghas_cache.json'))
     
     # Check if the org or repo arguments are present. If they are, set use_config to False. Otherwise, set use_config to True
     use_config = not (args.org or args.repo)
@@ -905,16 +1834,54 @@ def process_args(parser):
         else config.get('projects', {})
     )
 
-    # Iterate through projects, alert types, and output types
-    for project_name, project_data in projects.items():
+    # Convert the project data once, instead of looking up the owner, organizations, and repositories in the nested dictionaries again for every request
+    projects = {project_name: load_project(project_data) for project_name, project_data in projects.items()}
+
+    # Keep the report rows in a list if they are written to both CSV and XLSX, so that they are created only once
+    share_rows = 'csv' in output_types and 'xlsx' in output_types
+
+    # Alerts retrieved so far, shared by all projects so that organizations and repositories in multiple projects are retrieved only once
+    fetched_alerts = {}
+
+    # Repository checks so far, shared by all projects so that repositories in multiple projects are checked only once
+    checked_repositories = {}
+
+    def process_project(session, project_name, project_data):
+        """Retrieves the alerts of a project and writes the selected reports in all selected output formats."""
+        # Skip the repositories that don't exist, instead of requesting the alerts of every scan type for them
+        project_data = get_existing_repositories(session, api_url, project_data, checked_repositories)
+
+        # Retrieve the alerts once per project, and reuse them for the alert count and all report and output types
+        project_alerts = fetch_project_alerts(session, api_url, project_data, [scan for scan in all_scans.values() if scan in alert_types], alert_state, cache, fetched_alerts)
+        alert_count = process_alerts_count(session, api_url, project_data, selected_scans, project_alerts, cache) if 'alerts' in alert_types else None
+
         for alert_type in alert_types:
+            scan_data = None
             for output_type in output_types:
-                {
-                    'alerts': lambda: write_alerts(process_alerts_count(api_url, project_data, selected_scans), project_name, output_type, output_theme, report_dir, call_func='alert_count', time_stamp=time_stamp),
-                    'codescan': lambda output_type=output_type: write_alerts(process_scan_alerts(api_url, project_data, 'codescan', output_type, alert_state), project_name, output_type, output_theme, report_dir, call_func='code_scan', time_stamp=time_stamp),
-                    'secretscan': lambda output_type=output_type: write_alerts(process_scan_alerts(api_url, project_data, 'secretscan', output_type, alert_state), project_name, output_type, output_theme, report_dir, call_func='secret_scan', time_stamp=time_stamp),
-                    'dependabot': lambda output_type=output_type: write_alerts(process_scan_alerts(api_url, project_data, 'dependabot', output_type, alert_state), project_name, output_type, output_theme, report_dir, call_func='dependabot_scan', time_stamp=time_stamp),
-                }[alert_type]()
+                if alert_type == 'alerts':
+                    alert_data = alert_count
+                elif output_type == 'json':
+                    alert_data = process_scan_alerts(project_alerts, alert_type, output_type)
+                else:
+                    # Create the report rows of the scan type once, and reuse them for the other output types
+                    if scan_data is None:
+                        scan_data = process_scan_alerts(project_alerts, alert_type, output_type)
+                        if share_rows:
+                            scan_data['scan_alerts'] = list(scan_data['scan_alerts'])
+                    alert_data = scan_data
+                write_alerts(alert_data, project_name, output_type, output_theme, report_dir, call_func=REPORT_NAMES[alert_type], time_stamp=time_stamp, compress=compress_output)
+
+    # Process the projects concurrently, reusing a single session for all requests to the GitHub API
+    with create_session(api_key) as session, ThreadPoolExecutor(max_workers=args.jobs) as executor:
+        futures = [executor.submit(process_project, session, project_name, project_data) for project_name, project_data in projects.items()]
+
+        # Wait for all projects to complete, and raise any errors that occurred while writing the reports
+        for future in futures:
+            future.result()
+
+    # Write the updated response cache to the cache file
+    if cache is not None:
+        save_cache(cache)
 
 def execution_time(start_time):
     """Prints the script's execution time."""
@@ -929,7 +1896,10 @@ def main():
 
     # Call the setup_argparse function to configure the ArgumentParser object and assign the returned value to the parser variable, then call the process_args function to process the command-line arguments
     parser = setup_argparse()
-    process_args(parser)
+    try:
+        process_args(parser)
+    except AuthenticationError as e:
+        raise SystemExit(f"{e}\nYour API key might be invalid or expired. Please run the \"ghas_enc_key.py\" script to add a new API key.")
     
     # Call the execution_time function to print the script's execution time
     execution_time(start_time)